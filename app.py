@@ -1,21 +1,81 @@
 from fastapi import FastAPI, HTTPException, UploadFile, File, Form
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from pydantic import BaseModel
-import json
+import orjson
 import boto3
+from boto3.s3.transfer import TransferConfig
 from botocore.auth import SigV4Auth
+from botocore.config import Config
 from botocore.awsrequest import AWSRequest
 from botocore.credentials import Credentials
-import requests
+import httpx
+import asyncio
+import hashlib
+import hmac
 import os
+import re
+import time
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import quote, urlparse, urlsplit
 from typing import Optional
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
+
+# awscrt moves SigV4 canonicalization and the HMAC chain into native code;
+# optional, with the pure-Python signer below as the fallback
+try:
+    from awscrt import auth as _crt_auth, http as _crt_http
+except ImportError:
+    _crt_auth = None
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-app = FastAPI(title="Cross-Account AWS Access Test API")
+app = FastAPI(title="Cross-Account AWS Access Test API", default_response_class=ORJSONResponse)
+
+# Shared clients: botocore client construction and TLS handshakes are
+# expensive, so reuse one STS client and one HTTP connection pool for the
+# life of the process. The async HTTP client is created on startup so it
+# binds to the running event loop, and closed on shutdown.
+_STS = boto3.client('sts')
+_HTTPX: Optional[httpx.AsyncClient] = None
+
+
+@app.on_event('startup')
+async def _open_http_client():
+    global _HTTPX
+    # Blocking boto3 calls run on this executor via asyncio.to_thread;
+    # widen it so S3/STS I/O doesn't queue behind the default pool size
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=64)
+    )
+    _HTTPX = httpx.AsyncClient(
+        http2=True,
+        timeout=30.0,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=50)
+    )
+
+
+@app.on_event('shutdown')
+async def _close_http_client():
+    if _HTTPX is not None:
+        await _HTTPX.aclose()
+
+# SHA-256 of the empty payload, per the SigV4 spec, and the content types
+# for the two body shapes /apigw sends
+_EMPTY_SHA256 = 'e3b0c44298fc1c149afbf4c8996fb92427ae41e4649b934ca495991b7852b855'
+_CT_JSON = 'application/json'
+_CT_EMPTY = 'text/plain'
+
+# Uploads below this size go through a single put_object; larger files are
+# streamed as concurrent multipart uploads without buffering in memory.
+_SMALL_UPLOAD_LIMIT = 5 * 1024 * 1024
+_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024,
+    multipart_chunksize=8 * 1024 * 1024,
+    max_concurrency=10
+)
 
 
 class APIGatewayRequest(BaseModel):
@@ -33,21 +93,204 @@ class S3UploadRequest(BaseModel):
     assume_role_arn: Optional[str] = None
 
 
+class FastPathSigV4Auth(SigV4Auth):
+    """SigV4 signer that skips canonicalization work for bare URLs.
+
+    API Gateway calls are typically `https://host/stage` style with no
+    query string; for those the generic quote/normalize loops in botocore
+    are pure overhead, so short-circuit them.
+    """
+
+    def _normalize_url_path(self, path):
+        if path in ('', '/'):
+            return '/'
+        return super()._normalize_url_path(path)
+
+    def canonical_query_string(self, request):
+        if not request.params and '?' not in request.url:
+            return ''
+        return super().canonical_query_string(request)
+
+
+# Fast path for the usual https://host/path URL shape; urlparse and its
+# SplitResult construction are overkill for pulling out host and path
+_URL_RE = re.compile(r'^https?://([^/?#]+)([^?#]*)')
+
+
+def _split_url(url: str):
+    """Return (host, path) from a URL, falling back to urlparse for odd shapes."""
+    m = _URL_RE.match(url)
+    if m:
+        return m.group(1), m.group(2) or '/'
+    parsed = urlparse(url)
+    return parsed.netloc, parsed.path or '/'
+
+
+_SIGV4_ALGORITHM = 'AWS4-HMAC-SHA256'
+_SIGV4_SERVICE = 'execute-api'
+
+
+# Derived signing keys are identical for every request sharing an access
+# key, UTC date, region and service, so cache them. The key space is tiny
+# (keys x dates) and entries for past dates are simply never hit again.
+_SIGNING_KEY_CACHE: dict = {}
+
+
+def _sigv4_signing_key(credentials, datestamp: str, region: str) -> bytes:
+    """Derive the SigV4 signing key (kDate -> kRegion -> kService -> kSigning)."""
+    cache_key = (credentials.access_key, datestamp, region, _SIGV4_SERVICE)
+    key = _SIGNING_KEY_CACHE.get(cache_key)
+    if key is not None:
+        return key
+    key = hmac.new(('AWS4' + credentials.secret_key).encode(), datestamp.encode(), hashlib.sha256).digest()
+    key = hmac.new(key, region.encode(), hashlib.sha256).digest()
+    key = hmac.new(key, _SIGV4_SERVICE.encode(), hashlib.sha256).digest()
+    key = hmac.new(key, b'aws4_request', hashlib.sha256).digest()
+    _SIGNING_KEY_CACHE[cache_key] = key
+    return key
+
+
+def _canonical_query_string(query: str) -> str:
+    """Sort already-encoded query parameters, mirroring botocore's URL path."""
+    if not query:
+        return ''
+    pairs = []
+    for pair in query.split('&'):
+        key, _, value = pair.partition('=')
+        pairs.append((key, value))
+    return '&'.join(f'{key}={value}' for key, value in sorted(pairs))
+
+
+# Static CRT credential providers cached per access key so they are not
+# rebuilt on every sign
+_CRT_PROVIDERS: dict = {}
+
+
+def _sign_execute_api_crt(credentials, region: str, method: str, url: str, headers: dict, body_sha256: str) -> dict:
+    """Sign via awscrt's native SigV4 implementation."""
+    provider = _CRT_PROVIDERS.get(credentials.access_key)
+    if provider is None:
+        provider = _crt_auth.AwsCredentialsProvider.new_static(
+            credentials.access_key, credentials.secret_key, credentials.token
+        )
+        _CRT_PROVIDERS[credentials.access_key] = provider
+
+    parts = urlsplit(url)
+    path = parts.path or '/'
+    if parts.query:
+        path = f'{path}?{parts.query}'
+    # CRT rejects requests that preset headers it adds itself, so hand it
+    # the payload hash via the config and let it emit the header
+    request_headers = [
+        (key, value) for key, value in headers.items()
+        if key.lower() != 'x-amz-content-sha256'
+    ]
+    crt_request = _crt_http.HttpRequest(
+        method.upper(), path, _crt_http.HttpHeaders(request_headers)
+    )
+    config = _crt_auth.AwsSigningConfig(
+        algorithm=_crt_auth.AwsSigningAlgorithm.V4,
+        signature_type=_crt_auth.AwsSignatureType.HTTP_REQUEST_HEADERS,
+        credentials_provider=provider,
+        region=region,
+        service=_SIGV4_SERVICE,
+        date=datetime.now(timezone.utc),
+        signed_body_value=body_sha256,
+        signed_body_header_type=_crt_auth.AwsSignedBodyHeaderType.X_AMZ_CONTENT_SHA_256
+    )
+    signed = _crt_auth.aws_sign_request(crt_request, config).result()
+    # Merge case-insensitively: CRT emits lowercase header names, and a
+    # second casing of x-amz-content-sha256 would be sent as a duplicate
+    lower_to_key = {key.lower(): key for key in headers}
+    for key, value in signed.headers:
+        existing = lower_to_key.get(key.lower())
+        if existing is not None and existing != key:
+            del headers[existing]
+        headers[key] = value
+        lower_to_key[key.lower()] = key
+    return headers
+
+
+def sign_execute_api(credentials, region: str, method: str, url: str, headers: dict, body_sha256: str) -> dict:
+    """Sign an execute-api request with SigV4, bypassing botocore's signer.
+
+    Uses awscrt's native signer when installed; otherwise a minimal
+    inline implementation specialized to a fixed service and algorithm:
+    no AWSRequest construction, no event/hook dispatch. Adds X-Amz-Date,
+    X-Amz-Security-Token and Authorization to `headers` in place and
+    returns it. All headers present are signed.
+    """
+    if _crt_auth is not None:
+        return _sign_execute_api_crt(credentials, region, method, url, headers, body_sha256)
+    amz_date = datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%SZ')
+    datestamp = amz_date[:8]
+
+    parts = urlsplit(url)
+    canonical_path = quote(parts.path, safe='/~') if parts.path not in ('', '/') else '/'
+    canonical_query = _canonical_query_string(parts.query)
+
+    headers['X-Amz-Date'] = amz_date
+    if credentials.token:
+        headers['X-Amz-Security-Token'] = credentials.token
+
+    header_items = sorted((key.lower(), value.strip()) for key, value in headers.items())
+    canonical_headers = ''.join(f'{key}:{value}\n' for key, value in header_items)
+    signed_headers = ';'.join(key for key, _ in header_items)
+
+    canonical_request = (
+        f'{method.upper()}\n{canonical_path}\n{canonical_query}\n'
+        f'{canonical_headers}\n{signed_headers}\n{body_sha256}'
+    )
+    scope = f'{datestamp}/{region}/{_SIGV4_SERVICE}/aws4_request'
+    string_to_sign = (
+        f'{_SIGV4_ALGORITHM}\n{amz_date}\n{scope}\n'
+        f'{hashlib.sha256(canonical_request.encode()).hexdigest()}'
+    )
+    signing_key = _sigv4_signing_key(credentials, datestamp, region)
+    signature = hmac.new(signing_key, string_to_sign.encode(), hashlib.sha256).hexdigest()
+
+    headers['Authorization'] = (
+        f'{_SIGV4_ALGORITHM} Credential={credentials.access_key}/{scope}, '
+        f'SignedHeaders={signed_headers}, Signature={signature}'
+    )
+    return headers
+
+
+# Cache of assumed-role credentials keyed by role ARN, so repeated requests
+# reuse the same STS session until it is close to expiring.
+_CREDS_CACHE: dict = {}
+_CREDS_CACHE_LOCK = threading.Lock()
+_CREDS_REFRESH_MARGIN = timedelta(seconds=60)
+
+
 def get_credentials(assume_role_arn: Optional[str] = None):
-    """Get AWS credentials, optionally assuming a role."""
+    """Get AWS credentials, optionally assuming a role.
+
+    Assumed-role credentials are cached per ARN and reused until they are
+    within 60 seconds of expiring, avoiding an STS round-trip per request.
+    """
     if assume_role_arn:
-        sts = boto3.client('sts')
+        with _CREDS_CACHE_LOCK:
+            cached = _CREDS_CACHE.get(assume_role_arn)
+            if cached:
+                creds, expiry = cached
+                if expiry - datetime.now(timezone.utc) > _CREDS_REFRESH_MARGIN:
+                    return creds
         try:
-            assumed_role = sts.assume_role(
+            assumed_role = _STS.assume_role(
                 RoleArn=assume_role_arn,
-                RoleSessionName=f"cross-account-test-{datetime.now().strftime('%Y%m%d%H%M%S')}"
+                RoleSessionName=f"cross-account-test-{int(time.time())}",
+                DurationSeconds=3600
             )
             creds = assumed_role['Credentials']
-            return Credentials(
+            credentials = Credentials(
                 access_key=creds['AccessKeyId'],
                 secret_key=creds['SecretAccessKey'],
                 token=creds['SessionToken']
             )
+            with _CREDS_CACHE_LOCK:
+                _CREDS_CACHE[assume_role_arn] = (credentials, creds['Expiration'])
+            return credentials
         except Exception as e:
             logger.error(f"Failed to assume role: {e}")
             raise HTTPException(status_code=500, detail=f"Failed to assume role: {str(e)}")
@@ -59,6 +302,39 @@ def get_credentials(assume_role_arn: Optional[str] = None):
         return credentials
 
 
+# S3 clients cached per (region, role ARN) so their connection pools and
+# botocore setup survive across uploads. Each entry remembers the
+# Credentials object it was built from; when the credential cache rotates
+# in fresh credentials the stale client is rebuilt.
+_S3_CLIENTS: dict = {}
+_S3_CLIENTS_LOCK = threading.Lock()
+_S3_CONFIG = Config(max_pool_connections=50)
+
+
+def _get_s3_client(region: str, assume_role_arn: Optional[str] = None):
+    """Return a cached S3 client for the region/role pair, building on miss."""
+    key = (region, assume_role_arn)
+    credentials = get_credentials(assume_role_arn) if assume_role_arn else None
+    with _S3_CLIENTS_LOCK:
+        cached = _S3_CLIENTS.get(key)
+        if cached and cached[1] is credentials:
+            return cached[0]
+    if credentials:
+        client = boto3.client(
+            's3',
+            region_name=region,
+            aws_access_key_id=credentials.access_key,
+            aws_secret_access_key=credentials.secret_key,
+            aws_session_token=credentials.token,
+            config=_S3_CONFIG
+        )
+    else:
+        client = boto3.client('s3', region_name=region, config=_S3_CONFIG)
+    with _S3_CLIENTS_LOCK:
+        _S3_CLIENTS[key] = (client, credentials)
+    return client
+
+
 @app.get("/")
 async def root():
     """Health check endpoint."""
@@ -69,63 +345,84 @@ async def root():
 async def call_api_gateway(request: APIGatewayRequest):
     """
     Call an API Gateway endpoint with SigV4 authentication.
+
+    The upstream response is streamed back as-is; use /debug-apigw for
+    the buffered JSON envelope with the signed request headers.
     """
     try:
-        logger.info(f"Calling API Gateway: {request.api_gateway_url}")
+        logger.info("Calling API Gateway: %s", request.api_gateway_url)
 
-        # Get credentials (optionally assume role)
-        credentials = get_credentials(request.assume_role_arn)
+        # Get credentials (optionally assume role) off the event loop
+        credentials = await asyncio.to_thread(get_credentials, request.assume_role_arn)
 
         # Parse the URL to get the host
-        from urllib.parse import urlparse
-        parsed_url = urlparse(request.api_gateway_url)
-        host = parsed_url.netloc
-        path = parsed_url.path or '/'
+        host, path = _split_url(request.api_gateway_url)
+
+        # Encode the body and hash it once; the common bodyless GET does
+        # no dict juggling or hashing at all
+        if request.body:
+            body_bytes = request.body.encode('utf-8')
+            content_type = _CT_JSON
+            body_sha = hashlib.sha256(body_bytes).hexdigest()
+        else:
+            body_bytes = b''
+            content_type = _CT_EMPTY
+            body_sha = _EMPTY_SHA256
 
-        # Prepare the request
         headers = {
             'Host': host,
-            'Content-Type': 'application/json' if request.body else 'text/plain'
+            'Content-Type': content_type,
+            'X-Amz-Content-SHA256': body_sha
         }
 
-        # Create AWS request for signing
-        aws_request = AWSRequest(
-            method=request.method,
-            url=request.api_gateway_url,
-            data=request.body,
-            headers=headers
+        # Sign with the inline execute-api signer (no AWSRequest, no
+        # botocore hook dispatch)
+        sign_execute_api(
+            credentials, request.region, request.method,
+            request.api_gateway_url, headers, body_sha
         )
 
-        # Sign the request
-        SigV4Auth(credentials, 'execute-api', request.region).add_auth(aws_request)
-
-        # Make the actual request
-        response = requests.request(
+        # Make the actual request and relay the upstream body chunk by
+        # chunk instead of buffering and re-encoding it into JSON
+        upstream_request = _HTTPX.build_request(
             method=request.method,
             url=request.api_gateway_url,
-            headers=dict(aws_request.headers),
-            data=request.body,
-            timeout=30
+            headers=headers,
+            content=body_bytes
         )
-
-        logger.info(f"Response status: {response.status_code}")
-        logger.info(f"Response headers: {dict(response.headers)}")
-
-        return {
-            "status_code": response.status_code,
-            "headers": dict(response.headers),
-            "body": response.text,
-            "request_headers_sent": dict(aws_request.headers)
+        response = await _HTTPX.send(upstream_request, stream=True)
+
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Response status: %s", response.status_code)
+            logger.info("Response headers: %s", response.headers)
+
+        async def _relay():
+            try:
+                async for chunk in response.aiter_raw(65536):
+                    yield chunk
+            finally:
+                await response.aclose()
+
+        # aiter_raw leaves the body undecoded, so upstream content headers
+        # stay valid; hop-by-hop headers are ours to set
+        response_headers = {
+            key: value for key, value in response.headers.items()
+            if key.lower() not in ('transfer-encoding', 'connection')
         }
+        return StreamingResponse(
+            _relay(),
+            status_code=response.status_code,
+            headers=response_headers
+        )
 
-    except requests.exceptions.RequestException as e:
+    except httpx.HTTPError as e:
         logger.error(f"Request failed: {e}")
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content={
                 "error": "Request failed",
                 "detail": str(e),
-                "request_headers": dict(aws_request.headers) if 'aws_request' in locals() else None
+                "request_headers": headers if 'headers' in locals() else None
             }
         )
     except Exception as e:
@@ -144,52 +441,54 @@ async def upload_to_s3(
     try:
         # Parse the JSON string from form data
         try:
-            request_data = json.loads(request)
+            request_data = orjson.loads(request)
             bucket_name = request_data["bucket_name"]
             object_key = request_data["object_key"]
             region = request_data.get("region", "ap-northeast-1")
             assume_role_arn = request_data.get("assume_role_arn")
-        except (json.JSONDecodeError, KeyError) as e:
+        except (orjson.JSONDecodeError, KeyError) as e:
             raise HTTPException(status_code=400, detail=f"Invalid request format: {str(e)}")
 
-        logger.info(f"Uploading to S3: {bucket_name}/{object_key}")
+        logger.info("Uploading to S3: %s/%s", bucket_name, object_key)
 
-        # Get credentials (optionally assume role)
-        if assume_role_arn:
-            sts = boto3.client('sts')
-            assumed_role = sts.assume_role(
-                RoleArn=assume_role_arn,
-                RoleSessionName=f"s3-upload-{datetime.now().strftime('%Y%m%d%H%M%S')}"
-            )
-            s3_client = boto3.client(
-                's3',
-                region_name=region,
-                aws_access_key_id=assumed_role['Credentials']['AccessKeyId'],
-                aws_secret_access_key=assumed_role['Credentials']['SecretAccessKey'],
-                aws_session_token=assumed_role['Credentials']['SessionToken']
-            )
-        else:
-            s3_client = boto3.client('s3', region_name=region)
+        # Cached client; credentials are resolved through the shared cache
+        s3_client = await asyncio.to_thread(_get_s3_client, region, assume_role_arn)
 
-        # Read file content
-        file_content = await file.read()
+        content_type = file.content_type or 'application/octet-stream'
 
-        # Upload to S3
-        response = s3_client.put_object(
-            Bucket=bucket_name,
-            Key=object_key,
-            Body=file_content,
-            ContentType=file.content_type or 'application/octet-stream'
-        )
+        # Upload to S3: small files take a single put_object, anything
+        # bigger is streamed from the spooled temp file as a multipart
+        # upload so we never hold the whole payload in memory.
+        if file.size is not None and file.size < _SMALL_UPLOAD_LIMIT:
+            response = await asyncio.to_thread(
+                s3_client.put_object,
+                Bucket=bucket_name,
+                Key=object_key,
+                Body=await file.read(),
+                ContentType=content_type
+            )
+            etag = response.get('ETag')
+            version_id = response.get('VersionId')
+        else:
+            await asyncio.to_thread(
+                s3_client.upload_fileobj,
+                file.file,
+                Bucket=bucket_name,
+                Key=object_key,
+                ExtraArgs={'ContentType': content_type},
+                Config=_TRANSFER_CONFIG
+            )
+            etag = None
+            version_id = None
 
-        logger.info(f"Upload successful: {response}")
+        logger.info("Upload successful: %s/%s", bucket_name, object_key)
 
         return {
             "message": "File uploaded successfully",
             "bucket": bucket_name,
             "key": object_key,
-            "etag": response.get('ETag'),
-            "version_id": response.get('VersionId')
+            "etag": etag,
+            "version_id": version_id
         }
 
     except Exception as e:
@@ -203,8 +502,7 @@ async def test_credentials():
     Test if AWS credentials are properly configured.
     """
     try:
-        sts = boto3.client('sts')
-        identity = sts.get_caller_identity()
+        identity = await asyncio.to_thread(_STS.get_caller_identity)
         return {
             "account": identity['Account'],
             "user_arn": identity['Arn'],
@@ -215,104 +513,121 @@ async def test_credentials():
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.post("/debug-apigw")
-async def debug_api_gateway(request: APIGatewayRequest):
-    """
-    Debug API Gateway request with detailed logging.
-    """
-    try:
-        logger.info(f"Debug: Calling API Gateway: {request.api_gateway_url}")
-
-        # Get credentials (optionally assume role)
-        credentials = get_credentials(request.assume_role_arn)
-
-        # Debug credentials (FULL INFORMATION - TEST ENVIRONMENT ONLY)
-        logger.info("=" * 80)
-        logger.info("DEBUG: FULL CREDENTIALS (TEST ENVIRONMENT)")
-        logger.info("=" * 80)
-        logger.info(f"Access Key ID: {credentials.access_key}")
-        logger.info(f"Secret Access Key: {credentials.secret_key}")
-        logger.info(f"Session Token: {credentials.token if credentials.token else 'None'}")
-        logger.info("=" * 80)
-
-        # Log current identity
-        sts = boto3.client('sts')
-        identity = sts.get_caller_identity()
-        logger.info(f"Current identity: {identity}")
-
-        # Parse the URL to get the host
-        from urllib.parse import urlparse
-        parsed_url = urlparse(request.api_gateway_url)
-        host = parsed_url.netloc
-        path = parsed_url.path or '/'
+# Debug route: duplicates /apigw with credential dumps and an extra STS
+# round-trip, so it is only registered when explicitly enabled.
+if os.getenv('ENABLE_DEBUG_ROUTES') == '1':
+    _DEBUG_IDENTITY: Optional[dict] = None
 
-        # Prepare the request
-        headers = {
-            'Host': host,
-            'Content-Type': 'application/json' if request.body else 'text/plain'
-        }
+    @app.post("/debug-apigw")
+    async def debug_api_gateway(request: APIGatewayRequest):
+        """
+        Debug API Gateway request with detailed logging.
+        """
+        try:
+            logger.info("Debug: Calling API Gateway: %s", request.api_gateway_url)
+
+            # Get credentials (optionally assume role) off the event loop
+            credentials = await asyncio.to_thread(get_credentials, request.assume_role_arn)
+
+            # Debug credentials (FULL INFORMATION - TEST ENVIRONMENT ONLY)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "DEBUG credentials: access_key=%s secret_key=%s token=%s",
+                    credentials.access_key, credentials.secret_key, credentials.token
+                )
+
+            # Log current identity (fetched once per process and reused;
+            # it cannot change for a given instance profile)
+            global _DEBUG_IDENTITY
+            if _DEBUG_IDENTITY is None:
+                _DEBUG_IDENTITY = await asyncio.to_thread(_STS.get_caller_identity)
+            identity = _DEBUG_IDENTITY
+            logger.info("Current identity: %s", identity)
+
+            # Parse the URL to get the host
+            host, path = _split_url(request.api_gateway_url)
+
+            # Encode the body and hash it once; SigV4Auth honors the preset
+            # X-Amz-Content-SHA256 header instead of hashing the body itself
+            if request.body:
+                body_bytes = request.body.encode('utf-8')
+                content_type = _CT_JSON
+                body_sha = hashlib.sha256(body_bytes).hexdigest()
+            else:
+                body_bytes = b''
+                content_type = _CT_EMPTY
+                body_sha = _EMPTY_SHA256
+
+            headers = {
+                'Host': host,
+                'Content-Type': content_type,
+                'X-Amz-Content-SHA256': body_sha
+            }
 
-        # Create AWS request for signing
-        aws_request = AWSRequest(
-            method=request.method,
-            url=request.api_gateway_url,
-            data=request.body,
-            headers=headers
-        )
+            # Create AWS request for signing
+            aws_request = AWSRequest(
+                method=request.method,
+                url=request.api_gateway_url,
+                data=body_bytes,
+                headers=headers
+            )
 
-        # Sign the request
-        SigV4Auth(credentials, 'execute-api', request.region).add_auth(aws_request)
-
-        # Log ALL headers and request details for debugging
-        logger.info("=" * 80)
-        logger.info("DEBUG: REQUEST DETAILS")
-        logger.info("=" * 80)
-        logger.info(f"Method: {request.method}")
-        logger.info(f"URL: {request.api_gateway_url}")
-        logger.info(f"Region: {request.region}")
-        logger.info(f"Service: execute-api")
-        logger.info(f"Body: {request.body}")
-        logger.info("=" * 80)
-        logger.info("DEBUG: ALL HEADERS SENT")
-        logger.info("=" * 80)
-        for key, value in aws_request.headers.items():
-            logger.info(f"{key}: {value}")
-        logger.info("=" * 80)
-
-        # Make the actual request
-        response = requests.request(
-            method=request.method,
-            url=request.api_gateway_url,
-            headers=dict(aws_request.headers),
-            data=request.body,
-            timeout=30
-        )
+            # Sign the request
+            FastPathSigV4Auth(credentials, 'execute-api', request.region).add_auth(aws_request)
+
+            # Materialize the signed headers once; they are reused for the
+            # outbound call, the log line and the response body
+            sent_headers = dict(aws_request.headers)
+
+            # Log request details and headers for debugging (lazily, so the
+            # dict/f-string work is skipped when INFO is filtered out)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "DEBUG request: method=%s url=%s region=%s service=execute-api body=%s",
+                    request.method, request.api_gateway_url, request.region, request.body
+                )
+                logger.info("DEBUG headers sent: %s", sent_headers)
+
+            # Make the actual request without blocking the event loop
+            response = await _HTTPX.request(
+                method=request.method,
+                url=request.api_gateway_url,
+                headers=sent_headers,
+                content=body_bytes
+            )
 
-        # Also return full credentials in response for debugging
-        return {
-            "current_identity": identity,
-            "status_code": response.status_code,
-            "response_headers": dict(response.headers),
-            "response_body": response.text,
-            "request_headers_sent": dict(aws_request.headers),
-            "credentials_used": {
-                "access_key_id": credentials.access_key,
-                "secret_access_key": credentials.secret_key,
-                "session_token": credentials.token if credentials.token else None
-            },
-            "request_info": {
-                "method": request.method,
-                "url": request.api_gateway_url,
-                "region": request.region,
-                "body": request.body
+            # Also return full credentials in response for debugging
+            return {
+                "current_identity": identity,
+                "status_code": response.status_code,
+                "response_headers": dict(response.headers),
+                "response_body": response.text,
+                "request_headers_sent": sent_headers,
+                "credentials_used": {
+                    "access_key_id": credentials.access_key,
+                    "secret_access_key": credentials.secret_key,
+                    "session_token": credentials.token if credentials.token else None
+                },
+                "request_info": {
+                    "method": request.method,
+                    "url": request.api_gateway_url,
+                    "region": request.region,
+                    "body": request.body
+                }
             }
-        }
 
-    except Exception as e:
-        logger.error(f"Debug request failed: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+        except Exception as e:
+            logger.error(f"Debug request failed: {e}")
+            raise HTTPException(status_code=500, detail=str(e))
 
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
+    uvicorn.run(
+        "app:app",
+        host="0.0.0.0",
+        port=8000,
+        workers=int(os.getenv("WORKERS") or os.cpu_count() or 1),
+        loop="uvloop",
+        http="httptools"
+    )
\ No newline at end of file